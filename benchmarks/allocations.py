@@ -0,0 +1,81 @@
+"""
+Measure the memory allocated per request by the region chart filters.
+
+Compares the previous approach, which copied the whole DataFrame before
+filtering it, with filtering the shared read-only `DatasetSnapshot`. The
+dataset is repeated to show how each approach grows with its size.
+
+Run from the repository root:
+
+    python -m benchmarks.allocations
+"""
+import tracemalloc
+
+import pandas as pd
+
+from src.data import DatasetSnapshot, load_data
+
+SALARY_RANGE = [30000, 70000]
+JOB_TYPES = ["Full-time"]
+EXPERIENCE_LEVELS = ["Entry level"]
+
+
+def filter_copy(df):
+    """Filter the way the callbacks did before snapshots, starting with a copy."""
+    min_salary, max_salary = SALARY_RANGE
+    filtered_df = df.copy()
+    filtered_df = filtered_df[
+        (filtered_df["min_salary"] >= min_salary)
+        & (filtered_df["max_salary"] <= max_salary)
+    ]
+    filtered_df = filtered_df[filtered_df["formatted_work_type"].isin(JOB_TYPES)]
+    filtered_df = filtered_df[
+        filtered_df["formatted_experience_level"].isin(EXPERIENCE_LEVELS)
+    ]
+    return filtered_df[["region", "min_salary", "max_salary"]]
+
+
+def filter_snapshot(snapshot):
+    """Filter the way the callbacks do now, with a row mask over the snapshot."""
+    min_salary, max_salary = SALARY_RANGE
+    rows = (snapshot["min_salary"] >= min_salary) & (
+        snapshot["max_salary"] <= max_salary
+    )
+    rows &= snapshot.isin("formatted_work_type", JOB_TYPES)
+    rows &= snapshot.isin("formatted_experience_level", EXPERIENCE_LEVELS)
+    return snapshot.take(rows, ["region", "min_salary", "max_salary"])
+
+
+def peak_allocation(func, data):
+    """Return the peak bytes allocated by one call, after a warm-up call."""
+    func(data)
+    tracemalloc.start()
+    result = func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, len(result)
+
+
+def main():
+    df = load_data()
+
+    print(
+        f"{'rows':>10}{'result rows':>13}{'dataset MB':>12}"
+        f"{'copy KB':>11}{'snapshot KB':>13}{'snapshot B/row':>16}"
+    )
+    for repeat in [1, 10, 50]:
+        data = pd.concat([df] * repeat, ignore_index=True)
+        snapshot = DatasetSnapshot.from_frame(data)
+        dataset_mb = data.memory_usage(deep=True).sum() / 1024**2
+
+        copy_peak, n_result = peak_allocation(filter_copy, data)
+        snapshot_peak, _ = peak_allocation(filter_snapshot, snapshot)
+        print(
+            f"{len(data):>10}{n_result:>13}{dataset_mb:>12.1f}"
+            f"{copy_peak / 1024:>11.0f}{snapshot_peak / 1024:>13.0f}"
+            f"{snapshot_peak / len(data):>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
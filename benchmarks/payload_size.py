@@ -0,0 +1,116 @@
+"""
+Measure response payload sizes of the dashboard across typical interactions.
+
+Each response is requested without compression, with gzip and with brotli.
+The layout and favicon are served from bodies compressed once at startup.
+The custom stylesheet is below the size threshold and is always sent as is.
+Callback responses are compressed on the first request, and repeats of the
+same body reuse the cached compressed bytes. The compression counters are
+printed at the end.
+
+Run from the repository root:
+
+    python -m benchmarks.payload_size
+"""
+from src.app import app, compression_stats
+
+DATASET_INPUT = {"id": "dataset-dropdown", "property": "value", "value": "US 2023"}
+
+REGION_INPUTS = [
+    DATASET_INPUT,
+    {"id": "salary-range-slider", "property": "value", "value": [30000, 70000]},
+    {"id": "job-type-checklist", "property": "value", "value": ["Full-time"]},
+    {"id": "experience-level-checklist", "property": "value", "value": ["Entry level"]},
+    {"id": "title-search", "property": "value", "value": ""},
+]
+
+
+def callback_body(output, inputs):
+    """Build the JSON body Dash's renderer posts for a single-output callback."""
+    component_id, prop = output.split(".")
+    return {
+        "output": output,
+        "outputs": {"id": component_id, "property": prop},
+        "inputs": inputs,
+        "changedPropIds": [f"{inputs[0]['id']}.{inputs[0]['property']}"],
+        "state": [],
+    }
+
+
+INTERACTIONS = [
+    ("page load: layout", "GET", "/_dash-layout", None),
+    ("page load: dependencies", "GET", "/_dash-dependencies", None),
+    ("page load: custom css", "GET", "/assets/custom_styles.css", None),
+    ("page load: favicon", "GET", "/_favicon.ico", None),
+    (
+        "map: all states",
+        "POST",
+        "/_dash-update-component",
+        callback_body(
+            "job-posting.figure",
+            [DATASET_INPUT, {"id": "state-dropdown", "property": "value", "value": None}],
+        ),
+    ),
+    (
+        "map: CA, NY, TX",
+        "POST",
+        "/_dash-update-component",
+        callback_body(
+            "job-posting.figure",
+            [
+                DATASET_INPUT,
+                {"id": "state-dropdown", "property": "value", "value": ["CA", "NY", "TX"]},
+            ],
+        ),
+    ),
+    (
+        "bar chart: default filters",
+        "POST",
+        "/_dash-update-component",
+        callback_body("jobs-by-region-bar-chart.figure", REGION_INPUTS),
+    ),
+    (
+        "salary chart: default filters",
+        "POST",
+        "/_dash-update-component",
+        callback_body("avg-min-max-salary-region.figure", REGION_INPUTS),
+    ),
+]
+
+
+def main():
+    client = app.server.test_client()
+    totals = {"identity": 0, "gzip": 0, "br": 0}
+
+    print(f"{'interaction':<32}{'identity':>10}{'gzip':>10}{'br':>10}{'ratio':>8}")
+    for name, method, path, body in INTERACTIONS:
+        sizes = {}
+        for encoding in totals:
+            response = client.open(
+                path, method=method, json=body, headers={"Accept-Encoding": encoding}
+            )
+            sizes[encoding] = len(response.data)
+            totals[encoding] += sizes[encoding]
+        ratio = sizes["identity"] / min(sizes["gzip"], sizes["br"])
+        print(
+            f"{name:<32}{sizes['identity']:>10}{sizes['gzip']:>10}"
+            f"{sizes['br']:>10}{ratio:>7.1f}x"
+        )
+    print(
+        f"{'total':<32}{totals['identity']:>10}{totals['gzip']:>10}{totals['br']:>10}"
+    )
+
+    # A reload with a cached copy of the layout only needs the 304 status line
+    etag = client.get("/_dash-layout", headers={"Accept-Encoding": "br"}).headers["ETag"]
+    revalidated = client.get(
+        "/_dash-layout", headers={"Accept-Encoding": "br", "If-None-Match": etag}
+    )
+    print(
+        f"layout revalidation: {revalidated.status_code}, "
+        f"{len(revalidated.data)} bytes"
+    )
+    print(f"compression counters: {compression_stats}")
+
+
+if __name__ == "__main__":
+    main()
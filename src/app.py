@@ -1,12 +1,23 @@
+import os
 from dash import Dash
 import dash_bootstrap_components as dbc
-from src.data import load_data, preprocess_data
+from src.registry import DatasetRegistry
 from src.components import create_layout
 from src.callbacks import register_callbacks
+from src.compression import register_compression
 
-# Load and preprocess data
-df = load_data()
-jobs_by_region, avg_salary_by_region, avg_min_max_salaries_by_region = preprocess_data(df)
+# Datasets that can be selected, mapped to their processed data files.
+# The first one is the default.
+DATASETS = {
+    "US 2023": "data/processed/cleaned_job_postings.pkl",
+}
+
+# Datasets are loaded (with their aggregates and title search index) on first
+# use, and the least recently used ones are evicted beyond the memory budget
+registry = DatasetRegistry(
+    DATASETS,
+    memory_budget_mb=float(os.environ.get("DATASET_MEMORY_BUDGET_MB", 512)),
+)
 
 # Initialize Dash app
 app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
@@ -22,10 +33,17 @@ region_colors = {
 }
 
 # Set the layout of the app
-app.layout = create_layout(app, df)
+app.layout = create_layout(
+    app, registry.get().snapshot.take(columns=["state_code"]), registry.names
+)
 
 # Register callbacks for interactivity
-register_callbacks(app, df, jobs_by_region, avg_min_max_salaries_by_region, region_colors)
+register_callbacks(app, registry, region_colors)
+
+# Compress responses, precompressing the static layout and favicon
+compression_stats = register_compression(
+    app.server, precompress_paths=["/_dash-layout", "/_favicon.ico"]
+)
 
 # Needed for deploying
 server = app.server
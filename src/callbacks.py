@@ -2,15 +2,15 @@ from dash.dependencies import Input, Output, State
 import plotly.express as px
 import plotly.graph_objs as go
 from dash.exceptions import PreventUpdate
+from dash import html
+import pandas as pd
 from flask_caching import Cache
 import dash
 
 
 def register_callbacks(
     app,
-    df,
-    jobs_by_region,
-    avg_min_max_salaries_by_region,
+    registry,
     region_colors,
 ):
 
@@ -24,10 +24,54 @@ def register_callbacks(
         },
     )
 
+    # Every data callback takes the dataset name as its first argument, so the
+    # memoized results are cached per dataset
+    @app.callback(
+        [
+            Output("state-dropdown", "options"),
+            Output("state-dropdown", "value", allow_duplicate=True),
+        ],
+        [Input("dataset-dropdown", "value")],
+        [State("state-dropdown", "value")],
+        prevent_initial_call=True,
+    )
+    @cache.memoize(timeout=300)  # Cache for 5 minutes
+    def update_state_options(dataset_name, selected_states):
+        """
+        Update the state dropdown to the states in the selected dataset.
+
+        The options are replaced by the states of the new dataset, and any
+        selected states it does not contain are dropped from the selection.
+
+        Parameters
+        ----------
+        dataset_name : str
+            The name of the selected dataset in the registry.
+        selected_states : list of str
+            The state codes currently selected in the dropdown.
+
+        Returns
+        -------
+        tuple of (list of dict, list of str)
+            The dropdown options, one per state code in the dataset, and the
+            selected states that remain valid.
+        """
+        snapshot = registry.get(dataset_name).snapshot
+        states = pd.unique(snapshot["state_code"])
+        options = [{"label": state, "value": state} for state in states]
+        if selected_states:
+            selected_states = [state for state in selected_states if state in states]
+        return options, selected_states
+
+
+
     # edited by Andy Z.
-    @app.callback(Output("job-posting", "figure"), [Input("state-dropdown", "value")])
+    @app.callback(
+        Output("job-posting", "figure"),
+        [Input("dataset-dropdown", "value"), Input("state-dropdown", "value")],
+    )
     @cache.memoize(timeout=300)  # Cache for 5 minutes
-    def update_graph(selected_states=None):
+    def update_graph(dataset_name, selected_states=None):
         """
         Update the map based on the selected states.
 
@@ -37,6 +81,8 @@ def register_callbacks(
 
         Parameters
         ----------
+        dataset_name : str
+            The name of the selected dataset in the registry.
         selected_states : list of str, optional
             The list of selected state codes. If None, all states are considered.
 
@@ -46,10 +92,15 @@ def register_callbacks(
             A Plotly figure object represented as a dictionary, which is used to update the
             map in the Dash application.
         """
-        subdf = df[df["pay_period"] == "YEARLY"]
+        snapshot = registry.get(dataset_name).snapshot
+        yearly = snapshot.isin("pay_period", ["YEARLY"])
+        subdf = snapshot.take(yearly, ["state_code", "max_salary"])
         df_filtered = subdf
         if selected_states:
-            df_filtered = subdf[subdf["state_code"].isin(selected_states)]
+            df_filtered = snapshot.take(
+                yearly & snapshot.isin("state_code", selected_states),
+                ["state_code", "max_salary"],
+            )
 
         median_salary = (
             df_filtered.groupby("state_code")["max_salary"].median().reset_index()
@@ -158,13 +209,18 @@ def register_callbacks(
     @app.callback(
         Output("jobs-by-region-bar-chart", "figure"),
         [
+            Input("dataset-dropdown", "value"),
             Input("salary-range-slider", "value"),
             Input("job-type-checklist", "value"),
             Input("experience-level-checklist", "value"),
+            Input("title-search", "value"),
         ],
     )
     @cache.memoize(timeout=300)  # Cache for 5 minutes
-    def update_bar_chart(salary_range, selected_job_types, selected_experience_levels):
+    def update_bar_chart(
+        dataset_name,
+        salary_range, selected_job_types, selected_experience_levels, title_query=None
+    ):
         """
         Update the bar chart to display the number of job postings by region.
 
@@ -173,34 +229,40 @@ def register_callbacks(
 
         Parameters
         ----------
+        dataset_name : str
+            The name of the selected dataset in the registry.
         salary_range : list of [int, int]
             A two-element list specifying the minimum and maximum salary range for filtering job postings.
         selected_job_types : list of str
             A list of job types selected by the user for filtering.
         selected_experience_levels : list of str
             A list of experience levels selected by the user for filtering.
+        title_query : str, optional
+            The job title search text. Rows are matched through the title index,
+            with the last word treated as a prefix.
 
         Returns
         -------
         plotly.graph_objs._figure.Figure
             A Plotly figure object containing the updated bar chart of job postings by region.
         """
+        dataset = registry.get(dataset_name)
+        snapshot = dataset.snapshot
         min_salary, max_salary = salary_range
-        filtered_df = df.copy()
-        filtered_df = filtered_df[
-            (filtered_df["min_salary"] >= min_salary)
-            & (filtered_df["max_salary"] <= max_salary)
-        ]
+        # Build a row mask over the shared snapshot and only copy the matches
+        rows = (snapshot["min_salary"] >= min_salary) & (
+            snapshot["max_salary"] <= max_salary
+        )
         if selected_job_types:
-            filtered_df = filtered_df[
-                filtered_df["formatted_work_type"].isin(selected_job_types)
-            ]
+            rows &= snapshot.isin("formatted_work_type", selected_job_types)
         if selected_experience_levels:
-            filtered_df = filtered_df[
-                filtered_df["formatted_experience_level"].isin(
-                    selected_experience_levels
-                )
-            ]
+            rows &= snapshot.isin(
+                "formatted_experience_level", selected_experience_levels
+            )
+        title_mask = dataset.title_index.mask(title_query)
+        if title_mask is not None:
+            rows &= title_mask
+        filtered_df = snapshot.take(rows, ["region"])
 
         jobs_by_region_filtered = filtered_df["region"].value_counts().reset_index()
         jobs_by_region_filtered.columns = ["region", "count"]
@@ -232,14 +294,17 @@ def register_callbacks(
     @app.callback(
         Output("avg-min-max-salary-region", "figure"),
         [
+            Input("dataset-dropdown", "value"),
             Input("salary-range-slider", "value"),
             Input("job-type-checklist", "value"),
             Input("experience-level-checklist", "value"),
+            Input("title-search", "value"),
         ],
     )
     @cache.memoize(timeout=300)  # Cache for 5 minutes
     def update_min_max_salary_chart(
-        salary_range, selected_job_types, selected_experience_levels
+        dataset_name,
+        salary_range, selected_job_types, selected_experience_levels, title_query=None
     ):
         """
         Update the chart to display average minimum and maximum salaries by region.
@@ -250,34 +315,40 @@ def register_callbacks(
 
         Parameters
         ----------
+        dataset_name : str
+            The name of the selected dataset in the registry.
         salary_range : list of [int, int]
             A two-element list specifying the minimum and maximum salary range for filtering job postings.
         selected_job_types : list of str
             A list of job types selected by the user for filtering.
         selected_experience_levels : list of str
             A list of experience levels selected by the user for filtering.
+        title_query : str, optional
+            The job title search text. Rows are matched through the title index,
+            with the last word treated as a prefix.
 
         Returns
         -------
         plotly.graph_objs._figure.Figure
             A Plotly figure object containing the salary range chart by region.
         """
+        dataset = registry.get(dataset_name)
+        snapshot = dataset.snapshot
         min_salary, max_salary = salary_range
-        filtered_df = df.copy()
-        filtered_df = filtered_df[
-            (filtered_df["min_salary"] >= min_salary)
-            & (filtered_df["max_salary"] <= max_salary)
-        ]
+        # Build a row mask over the shared snapshot and only copy the matches
+        rows = (snapshot["min_salary"] >= min_salary) & (
+            snapshot["max_salary"] <= max_salary
+        )
         if selected_job_types:
-            filtered_df = filtered_df[
-                filtered_df["formatted_work_type"].isin(selected_job_types)
-            ]
+            rows &= snapshot.isin("formatted_work_type", selected_job_types)
         if selected_experience_levels:
-            filtered_df = filtered_df[
-                filtered_df["formatted_experience_level"].isin(
-                    selected_experience_levels
-                )
-            ]
+            rows &= snapshot.isin(
+                "formatted_experience_level", selected_experience_levels
+            )
+        title_mask = dataset.title_index.mask(title_query)
+        if title_mask is not None:
+            rows &= title_mask
+        filtered_df = snapshot.take(rows, ["region", "min_salary", "max_salary"])
 
         avg_min_max_salaries_by_region_filtered = (
             filtered_df.groupby("region")
@@ -323,6 +394,39 @@ def register_callbacks(
 
 
 
+    @app.callback(
+        Output("title-suggestions", "children"),
+        [Input("title-search", "value")],
+        [State("dataset-dropdown", "value")],
+        prevent_initial_call=True,
+    )
+    def update_title_suggestions(title_query, dataset_name):
+        """
+        Update the typeahead suggestions for the job title search box.
+
+        Parameters
+        ----------
+        title_query : str
+            The job title search text typed so far.
+        dataset_name : str
+            The name of the selected dataset in the registry.
+
+        Returns
+        -------
+        list of dash.html.Option
+            Suggested completions of the last word of the search text.
+        """
+        if not title_query:
+            return []
+
+        title_index = registry.get(dataset_name).title_index
+        return [
+            html.Option(value=completion)
+            for completion in title_index.complete(title_query)
+        ]
+
+
+
     @app.callback(
         Output("state-click-info", "children"),
         [Input("job-posting", "clickData")],
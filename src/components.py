@@ -1,7 +1,7 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
-def create_layout(app, df):
+def create_layout(app, df, dataset_names):
     """
     Create the layout for the Dash app.
 
@@ -10,7 +10,9 @@ def create_layout(app, df):
     app : dash.Dash
         The Dash application instance.
     df : pd.DataFrame
-        The DataFrame containing job postings data used to derive dynamic elements like state options.
+        The DataFrame of the default dataset, used to derive dynamic elements like state options.
+    dataset_names : list of str
+        The names of the datasets that can be selected. The first one is the default.
 
     Returns
     -------
@@ -27,6 +29,15 @@ def create_layout(app, df):
             html.H4("State Info", className="section-title"),
             html.Hr(),
 
+            html.H5("Dataset"),
+            dcc.Dropdown(
+                id="dataset-dropdown",
+                options=[{"label": name, "value": name} for name in dataset_names],
+                value=dataset_names[0],
+                clearable=False,
+            ),
+            html.Br(),
+
             html.H5("State Code"),
             dcc.Dropdown(
                 id="state-dropdown",
@@ -55,6 +66,17 @@ def create_layout(app, df):
                 tooltip={"placement": "bottom", "always_visible": True},
             ),
             html.Br(),
+            html.H5("Job Title"),
+            dcc.Input(
+                id="title-search",
+                type="text",
+                placeholder="e.g. data scientist",
+                list="title-suggestions",
+                value="",
+                className="form-control",
+            ),
+            html.Datalist(id="title-suggestions", children=[]),
+            html.Br(),
             html.H5("Job Type"),
             dbc.Checklist(
                 options=[
@@ -0,0 +1,210 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+    "image/vnd.microsoft.icon",
+    "image/x-icon",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+
+
+def compress(data, encoding, gzip_level=6, brotli_quality=5):
+    """
+    Compress a response body with the given content encoding.
+
+    Parameters
+    ----------
+    data : bytes
+        The uncompressed response body.
+    encoding : str
+        Either "br" or "gzip".
+    gzip_level : int, optional
+        The gzip compression level (1-9).
+    brotli_quality : int, optional
+        The brotli compression quality (0-11).
+
+    Returns
+    -------
+    bytes
+        The compressed response body.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the best content encoding the client accepts.
+
+    Parameters
+    ----------
+    accept_encoding : werkzeug.datastructures.MIMEAccept
+        The parsed `Accept-Encoding` header of the request.
+
+    Returns
+    -------
+    str or None
+        "br", "gzip", or None if the response should not be compressed.
+    """
+    if brotli is not None and accept_encoding["br"]:
+        return "br"
+    if accept_encoding["gzip"]:
+        return "gzip"
+    return None
+
+
+def content_hash(data):
+    """
+    Hash a response body for use as an ETag and as a compression cache key.
+
+    Parameters
+    ----------
+    data : bytes
+        The uncompressed response body.
+
+    Returns
+    -------
+    str
+        A short hex digest of the body.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def register_compression(
+    server,
+    precompress_paths=(),
+    min_size=500,
+    gzip_level=6,
+    brotli_quality=5,
+    cache_size=256,
+):
+    """
+    Compress responses from the Flask server and tag them with content hashes.
+
+    Every compressible response larger than `min_size` is compressed with
+    brotli or gzip, following the client's `Accept-Encoding` header. Responses
+    are keyed by a hash of their body, which is sent as the ETag: a repeated
+    identical body (a re-requested figure) reuses the stored compressed bytes,
+    and a GET whose `If-None-Match` matches gets an empty 304.
+
+    The GET responses at `precompress_paths` are fetched once when this is
+    called and compressed at the highest levels. Their compressed bodies are
+    kept for the life of the server. A later response to any path with the
+    same body is served from them, and a changed body is compressed like any
+    other response.
+
+    Parameters
+    ----------
+    server : flask.Flask
+        The Flask server of the Dash app (`app.server`). For Dash, call this
+        after the layout and callbacks are set, so the precompressed layout is
+        the one that will be served.
+    precompress_paths : list of str, optional
+        The paths of static GET responses to compress at startup, such as
+        "/_dash-layout" and "/_favicon.ico".
+    min_size : int, optional
+        Responses smaller than this many bytes are sent uncompressed.
+    gzip_level : int, optional
+        The gzip compression level (1-9) for responses compressed on request.
+    brotli_quality : int, optional
+        The brotli compression quality (0-11) for responses compressed on
+        request. Kept moderate since that happens on the request path.
+    cache_size : int, optional
+        The number of compressed bodies to keep in memory, not counting the
+        precompressed ones.
+
+    Returns
+    -------
+    dict
+        Counters of compressed, cached and not-modified responses, updated
+        as requests are served. Responses served from precompressed bodies
+        count as cache hits.
+    """
+    compressed_bodies = OrderedDict()
+    # Filled once below and only read afterwards, so it needs no lock
+    precompressed_bodies = {}
+    stats = {"compressed": 0, "cache_hits": 0, "not_modified": 0}
+    # Requests may be served from several threads sharing the cache
+    lock = threading.Lock()
+
+    def compress_cached(data, digest, encoding):
+        key = (digest, encoding)
+        with lock:
+            body = precompressed_bodies.get(key) or compressed_bodies.get(key)
+            if body is not None:
+                if key in compressed_bodies:
+                    compressed_bodies.move_to_end(key)
+                stats["cache_hits"] += 1
+                return body
+
+        # Compress outside the lock so other requests are not held up
+        body = compress(data, encoding, gzip_level, brotli_quality)
+        with lock:
+            compressed_bodies[key] = body
+            compressed_bodies.move_to_end(key)
+            while len(compressed_bodies) > cache_size:
+                compressed_bodies.popitem(last=False)
+            stats["compressed"] += 1
+        return body
+
+    @server.after_request
+    def compress_response(response):
+        if (
+            response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES
+            or response.direct_passthrough
+            or response.is_streamed
+        ):
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        digest = content_hash(data)
+
+        response.vary.add("Accept-Encoding")
+        encoding = choose_encoding(request.accept_encodings)
+        response.set_etag(digest if encoding is None else f"{digest}-{encoding}")
+        if request.method in ("GET", "HEAD"):
+            response.make_conditional(request)
+            if response.status_code == 304:
+                with lock:
+                    stats["not_modified"] += 1
+                return response
+        if encoding is None:
+            return response
+
+        response.set_data(compress_cached(data, digest, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    # Fetch the static responses once and compress them at the highest levels
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    client = server.test_client()
+    for path in precompress_paths:
+        response = client.get(path, headers={"Accept-Encoding": "identity"})
+        data = response.get_data()
+        if response.status_code != 200 or len(data) < min_size:
+            continue
+        digest = content_hash(data)
+        for encoding in encodings:
+            precompressed_bodies[(digest, encoding)] = compress(data, encoding, 9, 11)
+
+    return stats
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -21,7 +22,7 @@ def load_data(filepath="data/processed/cleaned_job_postings.pkl"):
 
 
 # preprocess data for visualizations
-def preprocess_data(df):
+def preprocess_data(df, avg_salary=None):
     """
     Preprocess job postings data for visualization.
 
@@ -29,6 +30,9 @@ def preprocess_data(df):
     ----------
     df : pd.DataFrame
         A pandas DataFrame containing job postings data.
+    avg_salary : array-like, optional
+        The precomputed average of the minimum and maximum salary of each row.
+        If None, it is computed from `df`.
 
     Returns
     -------
@@ -41,8 +45,11 @@ def preprocess_data(df):
     jobs_by_region = df["region"].value_counts().reset_index()
     jobs_by_region.columns = ["region", "count"]
 
-    df["avg_salary"] = df[["min_salary", "max_salary"]].mean(axis=1)
-    avg_salary_by_region = df.groupby("region")["avg_salary"].mean().reset_index()
+    # Kept on the side so the shared DataFrame is not modified
+    if avg_salary is None:
+        avg_salary = df[["min_salary", "max_salary"]].mean(axis=1)
+    avg_salary = pd.Series(avg_salary, index=df.index, name="avg_salary")
+    avg_salary_by_region = avg_salary.groupby(df["region"]).mean().reset_index()
     avg_salary_by_region = avg_salary_by_region.sort_values(
         by="avg_salary", ascending=False
     )
@@ -56,3 +63,188 @@ def preprocess_data(df):
     )
 
     return jobs_by_region, avg_salary_by_region, avg_min_max_salaries_by_region
+
+
+# read-only view of a loaded dataset
+class DatasetSnapshot:
+    """
+    An immutable, column-oriented snapshot of job postings data.
+
+    Every column is held as a read-only NumPy array, so the snapshot can be
+    shared between requests without being copied or modified. Filters build
+    boolean masks over the columns, and only the selected rows and columns
+    are materialized with `take`.
+
+    Parameters
+    ----------
+    columns : dict of str to array-like
+        The column values, all of the same length.
+    """
+
+    def __init__(self, columns):
+        self._columns = {}
+        self._codes = {}
+        for name, values in columns.items():
+            array = np.asarray(values)
+            if array.flags.writeable:
+                array = array.copy()
+                array.flags.writeable = False
+            self._columns[name] = array
+
+        lengths = {len(array) for array in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a snapshot must have the same length.")
+        self._n_rows = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Create a snapshot from a DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The job postings data. It is not modified.
+
+        Returns
+        -------
+        DatasetSnapshot
+            A snapshot holding a read-only copy of every column of `df`.
+        """
+        columns = {}
+        for name in df.columns:
+            # Copy once here, as `to_numpy` may return a view of the DataFrame,
+            # and mark the copy read-only so the constructor keeps it as is
+            array = df[name].to_numpy(copy=True)
+            array.flags.writeable = False
+            columns[name] = array
+        return cls(columns)
+
+    def __len__(self):
+        return self._n_rows
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    @property
+    def columns(self):
+        """list of str: The column names."""
+        return list(self._columns)
+
+    def with_column(self, name, values):
+        """
+        Attach a derived column, returning a new snapshot.
+
+        The existing columns are shared with the new snapshot, not copied.
+
+        Parameters
+        ----------
+        name : str
+            The name of the derived column.
+        values : array-like
+            The column values, one per row.
+
+        Returns
+        -------
+        DatasetSnapshot
+            A snapshot with the existing columns and the new one.
+        """
+        if len(values) != self._n_rows:
+            raise ValueError(
+                f"Column {name!r} has {len(values)} rows, expected {self._n_rows}."
+            )
+        snapshot = DatasetSnapshot({**self._columns, name: values})
+        snapshot._codes = {k: v for k, v in self._codes.items() if k != name}
+        return snapshot
+
+    def factorize(self, name):
+        """
+        Get the integer codes and categories of a column, computing them once.
+
+        Parameters
+        ----------
+        name : str
+            The column to factorize.
+
+        Returns
+        -------
+        tuple of (np.ndarray, pd.Index)
+            The read-only code of each row (-1 for missing values) and the
+            distinct values the codes refer to.
+        """
+        if name not in self._codes:
+            codes, categories = pd.factorize(self._columns[name])
+            if len(categories) < np.iinfo(np.int32).max:
+                codes = codes.astype(np.int32)
+            codes.flags.writeable = False
+            self._codes[name] = (codes, pd.Index(categories))
+        return self._codes[name]
+
+    @property
+    def codes_nbytes(self):
+        """int: The bytes held by the cached codes of factorized columns."""
+        return sum(codes.nbytes for codes, _ in list(self._codes.values()))
+
+    def isin(self, name, values):
+        """
+        Build a boolean mask of the rows whose column value is in `values`.
+
+        The column is factorized once, so each call only maps integer codes
+        through a lookup table instead of comparing every value.
+
+        Parameters
+        ----------
+        name : str
+            The column to test.
+        values : list
+            The accepted values.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array with one entry per row.
+        """
+        codes, categories = self.factorize(name)
+        # The extra False entry is picked by the -1 code of missing values
+        lookup = np.append(categories.isin(values), False)
+        return lookup[codes]
+
+    def take(self, rows=None, columns=None):
+        """
+        Materialize the selected rows and columns as a new DataFrame.
+
+        Parameters
+        ----------
+        rows : np.ndarray, optional
+            The row positions or a boolean row mask. If None, all rows are taken.
+        columns : list of str, optional
+            The columns to include. If None, all columns are included.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame holding only the selected data.
+        """
+        columns = self.columns if columns is None else columns
+        if rows is None:
+            return pd.DataFrame({name: self._columns[name] for name in columns})
+        return pd.DataFrame({name: self._columns[name][rows] for name in columns})
+
+    def memory_usage(self):
+        """
+        Estimate the bytes held by the columns, including string contents.
+
+        The codes of factorized columns are counted separately by
+        `codes_nbytes`, since they are added after the snapshot is created.
+
+        Returns
+        -------
+        int
+            The estimated memory usage in bytes.
+        """
+        return int(
+            sum(
+                pd.Series(array, copy=False).memory_usage(deep=True, index=False)
+                for array in self._columns.values()
+            )
+        )
@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.data import DatasetSnapshot, load_data, preprocess_data
+from src.search import load_title_index
+
+# Columns the callbacks filter with `DatasetSnapshot.isin`
+FILTER_COLUMNS = [
+    "pay_period",
+    "state_code",
+    "formatted_work_type",
+    "formatted_experience_level",
+]
+
+
+class Dataset:
+    """
+    A loaded job postings dataset and the aggregates precomputed from it.
+
+    The data is kept as a read-only `DatasetSnapshot`, with the derived
+    `avg_salary` column attached once at load.
+
+    Parameters
+    ----------
+    name : str
+        The name the dataset is registered under.
+    df : pd.DataFrame
+        The job postings data. It is not modified or kept.
+    title_index : src.search.TitleIndex
+        The job title search index for `df`.
+    """
+
+    def __init__(self, name, df, title_index):
+        self.name = name
+        # Computed once, attached to the snapshot and reused by the aggregates
+        avg_salary = df[["min_salary", "max_salary"]].mean(axis=1).to_numpy()
+        self.snapshot = DatasetSnapshot.from_frame(df).with_column(
+            "avg_salary", avg_salary
+        )
+        (
+            self.jobs_by_region,
+            self.avg_salary_by_region,
+            self.avg_min_max_salaries_by_region,
+        ) = preprocess_data(df, avg_salary=self.snapshot["avg_salary"])
+        # Factorize the columns the callbacks filter on now, so their codes
+        # are part of the memory estimate from the start
+        for column in FILTER_COLUMNS:
+            if column in self.snapshot.columns:
+                self.snapshot.factorize(column)
+        self.title_index = title_index
+        self.load_seconds = None
+        self._fixed_bytes = self._fixed_memory_usage()
+
+    def _fixed_memory_usage(self):
+        """Estimate the bytes held by the columns, aggregates and title index."""
+        frames = [
+            self.jobs_by_region,
+            self.avg_salary_by_region,
+            self.avg_min_max_salaries_by_region,
+        ]
+        total = self.snapshot.memory_usage()
+        total += sum(int(frame.memory_usage(deep=True).sum()) for frame in frames)
+        total += sum(posting.nbytes for posting in self.title_index.postings)
+        total += sum(len(token) + 49 for token in self.title_index.vocabulary)
+        return total
+
+    @property
+    def memory_bytes(self):
+        """
+        int: The estimated bytes held by the dataset.
+
+        This includes the caches that grow while requests are served: the
+        codes of factorized columns and the merged title prefix postings.
+        """
+        return (
+            self._fixed_bytes
+            + self.snapshot.codes_nbytes
+            + self.title_index.cache_nbytes
+        )
+
+
+class DatasetRegistry:
+    """
+    Lazily load job postings datasets and keep them under a memory budget.
+
+    A dataset is loaded and preprocessed the first time it is requested. When
+    the loaded datasets use more than `memory_budget_mb`, the least recently
+    used ones are evicted whole, except the one just requested. The budget is
+    checked on every request, since the datasets' caches grow as they are used.
+
+    Loading happens outside the registry lock, so a cold load does not block
+    requests for datasets that are already loaded. Concurrent first requests
+    for the same dataset wait for a single load.
+
+    Parameters
+    ----------
+    sources : dict of str to str
+        The dataset names, in display order, mapped to their pickle file paths.
+        The first one is the default dataset.
+    memory_budget_mb : float, optional
+        The memory budget for loaded datasets, in megabytes. If None, loaded
+        datasets are never evicted.
+    """
+
+    def __init__(self, sources, memory_budget_mb=None):
+        if not sources:
+            raise ValueError("At least one dataset source is required.")
+        self.sources = dict(sources)
+        self.memory_budget_bytes = (
+            None if memory_budget_mb is None else memory_budget_mb * 1024**2
+        )
+        self._loaded = OrderedDict()
+        self._stats = {
+            name: {"loads": 0, "hits": 0, "evictions": 0, "load_seconds": None}
+            for name in self.sources
+        }
+        self._lock = threading.Lock()
+        self._load_locks = {}
+
+    @property
+    def names(self):
+        """list of str: The registered dataset names, in display order."""
+        return list(self.sources)
+
+    @property
+    def default(self):
+        """str: The name of the default dataset."""
+        return self.names[0]
+
+    @property
+    def memory_bytes(self):
+        """int: The estimated bytes held by all loaded datasets."""
+        return sum(dataset.memory_bytes for dataset in self._loaded.values())
+
+    def get(self, name=None):
+        """
+        Get a dataset, loading it first if it is not resident.
+
+        Parameters
+        ----------
+        name : str, optional
+            The dataset name. If None, the default dataset is returned.
+
+        Returns
+        -------
+        Dataset
+            The loaded dataset with its precomputed aggregates.
+        """
+        name = name or self.default
+        if name not in self.sources:
+            raise KeyError(f"Unknown dataset: {name!r}")
+
+        dataset = self._get_loaded(name)
+        if dataset is not None:
+            return dataset
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+        with load_lock:
+            # Another request may have loaded it while this one waited
+            dataset = self._get_loaded(name)
+            if dataset is not None:
+                return dataset
+
+            filepath = self.sources[name]
+            start = time.perf_counter()
+            df = load_data(filepath)
+            title_index = load_title_index(df, filepath)
+            dataset = Dataset(name, df, title_index)
+            dataset.load_seconds = time.perf_counter() - start
+
+            with self._lock:
+                self._loaded[name] = dataset
+                self._stats[name]["loads"] += 1
+                self._stats[name]["load_seconds"] = dataset.load_seconds
+                self._evict(keep=name)
+            return dataset
+
+    def _get_loaded(self, name):
+        """Return a resident dataset and mark it as recently used, or None."""
+        with self._lock:
+            if name not in self._loaded:
+                return None
+            self._loaded.move_to_end(name)
+            self._stats[name]["hits"] += 1
+            self._evict(keep=name)
+            return self._loaded[name]
+
+    def _evict(self, keep):
+        """
+        Evict least recently used datasets until within the memory budget.
+
+        Must be called with the registry lock held.
+        """
+        if self.memory_budget_bytes is None:
+            return
+        while self.memory_bytes > self.memory_budget_bytes and len(self._loaded) > 1:
+            name = next(n for n in self._loaded if n != keep)
+            del self._loaded[name]
+            self._stats[name]["evictions"] += 1
+
+    def metrics(self):
+        """
+        Report memory and load-time metrics for each registered dataset.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per dataset with columns ['dataset', 'loaded',
+            'memory_mb', 'loads', 'hits', 'evictions', 'load_seconds'].
+        """
+        rows = []
+        with self._lock:
+            for name in self.sources:
+                dataset = self._loaded.get(name)
+                rows.append(
+                    {
+                        "dataset": name,
+                        "loaded": dataset is not None,
+                        "memory_mb": (
+                            dataset.memory_bytes / 1024**2
+                            if dataset is not None
+                            else 0.0
+                        ),
+                        **self._stats[name],
+                    }
+                )
+        return pd.DataFrame(rows)
@@ -0,0 +1,414 @@
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import threading
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+INDEX_VERSION = 1
+PREFIX_CACHE_SIZE = 256
+
+
+def tokenize(text):
+    """
+    Split a job title into lowercase alphanumeric tokens.
+
+    Parameters
+    ----------
+    text : str
+        The job title or search query to tokenize.
+
+    Returns
+    -------
+    list of str
+        The tokens in the order they appear in the text.
+    """
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class TitleIndex:
+    """
+    Inverted index over the `title` column of the job postings data.
+
+    Each token maps to the rows whose title contains it. Rare tokens store a
+    sorted array of row positions, while common tokens store a packed bitmap
+    with one bit per row, whichever is smaller. The vocabulary is kept sorted
+    so that a prefix lookup is a binary search over the tokens, which is what
+    makes typeahead cheap.
+
+    Parameters
+    ----------
+    vocabulary : list of str
+        The sorted list of distinct tokens.
+    postings : list of np.ndarray
+        For each token in `vocabulary`, either the sorted `int32` row positions
+        containing it, or a packed `uint8` row bitmap.
+    counts : np.ndarray
+        For each token in `vocabulary`, the number of rows containing it.
+    n_rows : int
+        The number of rows in the indexed DataFrame.
+    fingerprint : int
+        A hash of the indexed titles, used to detect a stale index on disk.
+    """
+
+    def __init__(self, vocabulary, postings, counts, n_rows, fingerprint):
+        self.vocabulary = vocabulary
+        self.postings = postings
+        self.counts = counts
+        self.n_rows = n_rows
+        self.fingerprint = fingerprint
+        self._prefix_cache = {}
+        # Requests may be served from several threads sharing the cache
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_prefix_cache"] = {}
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    @property
+    def cache_nbytes(self):
+        """int: The bytes held by the cached postings of merged prefixes."""
+        with self._cache_lock:
+            return sum(posting.nbytes for posting in self._prefix_cache.values())
+
+    @classmethod
+    def build(cls, titles):
+        """
+        Build the index from a Series of job titles.
+
+        Parameters
+        ----------
+        titles : pd.Series
+            The job titles, in the row order of the DataFrame.
+
+        Returns
+        -------
+        TitleIndex
+            The built index.
+        """
+        n_rows = len(titles)
+        rows_by_token = {}
+        for row, title in enumerate(titles):
+            for token in set(tokenize(title)):
+                rows_by_token.setdefault(token, []).append(row)
+
+        vocabulary = sorted(rows_by_token)
+        postings = [
+            _compact(np.asarray(rows_by_token[token], dtype=np.int32), n_rows)
+            for token in vocabulary
+        ]
+        counts = np.array([len(rows_by_token[token]) for token in vocabulary])
+        return cls(vocabulary, postings, counts, n_rows, title_fingerprint(titles))
+
+    def _token_range(self, prefix):
+        """Return the vocabulary slice of tokens starting with `prefix`."""
+        start = bisect_left(self.vocabulary, prefix)
+        stop = bisect_left(self.vocabulary, prefix + "\uffff", lo=start)
+        return start, stop
+
+    def _exact_rows(self, token):
+        """Return the posting of an exact token match."""
+        i = bisect_left(self.vocabulary, token)
+        if i < len(self.vocabulary) and self.vocabulary[i] == token:
+            return self.postings[i]
+        return np.empty(0, dtype=np.int32)
+
+    def _prefix_rows(self, prefix):
+        """Return the merged posting of every token starting with `prefix`."""
+        start, stop = self._token_range(prefix)
+        if start == stop:
+            return np.empty(0, dtype=np.int32)
+        if stop - start == 1:
+            return self.postings[start]
+
+        # Short prefixes expand to many tokens, so remember the merged rows
+        with self._cache_lock:
+            rows = self._prefix_cache.get(prefix)
+        if rows is not None:
+            return rows
+
+        # Merge outside the lock so other requests are not held up
+        bitmap = np.zeros(self.n_rows, dtype=bool)
+        for posting in self.postings[start:stop]:
+            if posting.dtype == np.uint8:
+                bitmap |= _to_bitmap(posting, self.n_rows)
+            else:
+                bitmap[posting] = True
+        rows = _compact(np.flatnonzero(bitmap).astype(np.int32), self.n_rows)
+
+        with self._cache_lock:
+            self._prefix_cache[prefix] = rows
+            while len(self._prefix_cache) > PREFIX_CACHE_SIZE:
+                self._prefix_cache.pop(next(iter(self._prefix_cache)))
+        return rows
+
+    def _search(self, query):
+        """Return the posting matching every token of the query, or None."""
+        matches = _query_matches(query)
+        if not matches:
+            return None
+
+        candidates = [self._exact_rows(match.group()) for match in matches[:-1]]
+        last = matches[-1]
+        if last.end() == len(last.string):
+            candidates.append(self._prefix_rows(last.group()))
+        else:
+            # The query ends in punctuation or whitespace, so its last word
+            # is finished and must match exactly
+            candidates.append(self._exact_rows(last.group()))
+
+        sparse = sorted((c for c in candidates if c.dtype != np.uint8), key=len)
+        dense = [c for c in candidates if c.dtype == np.uint8]
+        if not sparse:
+            result = dense[0]
+            for bitmap in dense[1:]:
+                result = np.bitwise_and(result, bitmap)
+            return result
+
+        # Filter the smallest row array through every other posting
+        rows = sparse[0]
+        for other in sparse[1:] + dense:
+            if len(rows) == 0:
+                break
+            rows = _intersect(rows, other)
+        return rows
+
+    def lookup(self, query):
+        """
+        Find the rows whose title matches every token of the query.
+
+        All query tokens must match exactly except the last one, which is
+        treated as a prefix so partially typed words still match. If the query
+        ends in punctuation or whitespace, the last word is finished and must
+        match exactly too.
+
+        Parameters
+        ----------
+        query : str
+            The search text entered by the user.
+
+        Returns
+        -------
+        np.ndarray or None
+            The sorted row positions matching the query, or None if the query
+            has no tokens (i.e. no title filter should be applied).
+        """
+        result = self._search(query)
+        if result is None or result.dtype != np.uint8:
+            return result
+        return np.flatnonzero(_to_bitmap(result, self.n_rows)).astype(np.int32)
+
+    def mask(self, query):
+        """
+        Return a boolean row bitmap for the query.
+
+        The bitmap has one entry per row of the indexed DataFrame, so it can be
+        combined with other boolean filters using `&`.
+
+        Parameters
+        ----------
+        query : str
+            The search text entered by the user.
+
+        Returns
+        -------
+        np.ndarray or None
+            A boolean array of length `n_rows`, or None if the query is empty.
+        """
+        result = self._search(query)
+        if result is None:
+            return None
+        return _to_bitmap(result, self.n_rows)
+
+    def suggest(self, prefix, limit=10):
+        """
+        Suggest indexed tokens starting with the given prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The partially typed word.
+        limit : int, optional
+            The maximum number of suggestions to return.
+
+        Returns
+        -------
+        list of str
+            Matching tokens, most frequent first.
+        """
+        tokens = tokenize(prefix)
+        if not tokens:
+            return []
+        start, stop = self._token_range(tokens[-1])
+        ranked = np.argsort(-self.counts[start:stop], kind="stable")[:limit]
+        return [self.vocabulary[start + i] for i in ranked]
+
+    def complete(self, query, limit=10):
+        """
+        Complete the last word of a search query with indexed tokens.
+
+        The text before the last word, including any punctuation, is kept as
+        typed. Nothing is suggested once the query ends in a non-alphanumeric
+        character, since the last word is then already finished.
+
+        Parameters
+        ----------
+        query : str
+            The search text typed so far.
+        limit : int, optional
+            The maximum number of completions to return.
+
+        Returns
+        -------
+        list of str
+            The completed queries, most frequent last word first.
+        """
+        matches = _query_matches(query)
+        if not matches or matches[-1].end() != len(matches[-1].string):
+            return []
+        head = query[: matches[-1].start()]
+        return [head + token for token in self.suggest(matches[-1].group(), limit)]
+
+
+def _query_matches(query):
+    """Return the token matches of a lowercased search query."""
+    if not isinstance(query, str):
+        return []
+    return list(TOKEN_PATTERN.finditer(query.lower()))
+
+
+def _compact(rows, n_rows):
+    """Store sorted rows as an array, or as a packed bitmap if that is smaller."""
+    # An int32 row costs 32 bits, a bitmap costs one bit for every row
+    if len(rows) * 32 > n_rows:
+        bitmap = np.zeros(n_rows, dtype=bool)
+        bitmap[rows] = True
+        return np.packbits(bitmap)
+    return rows
+
+
+def _to_bitmap(posting, n_rows):
+    """Expand a posting into a boolean array with one entry per row."""
+    if posting.dtype == np.uint8:
+        return np.unpackbits(posting, count=n_rows).view(bool)
+    bitmap = np.zeros(n_rows, dtype=bool)
+    bitmap[posting] = True
+    return bitmap
+
+
+def _intersect(rows, other):
+    """Keep the sorted `rows` that also appear in the `other` posting."""
+    if other.dtype == np.uint8:
+        bits = (other[rows >> 3] >> (7 - (rows & 7))) & 1
+        return rows[bits.astype(bool)]
+    positions = np.searchsorted(other, rows)
+    positions[positions == len(other)] = 0
+    return rows[other[positions] == rows]
+
+
+def title_fingerprint(titles):
+    """
+    Hash the titles so a saved index can be checked against the data.
+
+    Parameters
+    ----------
+    titles : pd.Series
+        The job titles.
+
+    Returns
+    -------
+    int
+        A hash of the title values and their order.
+    """
+    hashed = pd.util.hash_pandas_object(titles.fillna(""), index=False)
+    digest = hashlib.blake2b(hashed.to_numpy().tobytes(), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def title_index_path(filepath):
+    """
+    Get the path of the title index stored next to a processed dataset.
+
+    Parameters
+    ----------
+    filepath : str
+        The file path to the processed dataset pickle file.
+
+    Returns
+    -------
+    str
+        The file path of the matching title index pickle file.
+    """
+    root, _ = os.path.splitext(filepath)
+    return f"{root}_title_index.pkl"
+
+
+def load_title_index(df, filepath="data/processed/cleaned_job_postings.pkl"):
+    """
+    Load the title index for a dataset, building and saving it if needed.
+
+    The index is saved next to the processed dataset. It is rebuilt when the
+    saved copy is missing or no longer matches the titles in `df`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The job postings data, with a `title` column.
+    filepath : str
+        The file path to the processed dataset the data was loaded from.
+
+    Returns
+    -------
+    TitleIndex
+        The title index for `df`.
+    """
+    index_path = title_index_path(filepath)
+    fingerprint = title_fingerprint(df["title"])
+
+    saved = None
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "rb") as f:
+                saved = pickle.load(f)
+        except Exception:
+            # A truncated or outdated file (UnpicklingError, EOFError,
+            # AttributeError, ...) is treated as a stale index
+            saved = None
+    if (
+        isinstance(saved, dict)
+        and saved.get("version") == INDEX_VERSION
+        and saved["index"].n_rows == len(df)
+        and saved["index"].fingerprint == fingerprint
+    ):
+        return saved["index"]
+
+    index = TitleIndex.build(df["title"])
+    # Write to a temporary file and move it into place, so that other
+    # processes building the same index never read a half-written file
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(index_path) or ".",
+            prefix=os.path.basename(index_path) + ".",
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"version": INDEX_VERSION, "index": index}, f)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # A read-only deployment can still serve the index from memory
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return index
@@ -0,0 +1,94 @@
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import sys
+sys.path.append('../src')
+from flask import Flask, jsonify
+from src.compression import register_compression
+
+def create_server(precompress_paths=()):
+    server = Flask(__name__)
+    layout = {"version": 1}
+
+    @server.route("/layout")
+    def serve_layout():
+        return jsonify({"children": ["div"] * 200, **layout})
+
+    @server.route("/figure", methods=["GET", "POST"])
+    def figure():
+        return jsonify({"data": [{"x": list(range(200))}]})
+
+    @server.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    stats = register_compression(server, precompress_paths)
+    return server.test_client(), stats, layout
+
+def test_compresses_large_responses():
+    client, stats, _ = create_server()
+    response = client.post("/figure", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b'"x"' in gzip.decompress(response.data)
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert stats["compressed"] == 1
+
+def test_skips_small_and_unaccepted_responses():
+    client, _, _ = create_server()
+    assert "Content-Encoding" not in client.get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    ).headers
+    assert "Content-Encoding" not in client.get("/figure").headers
+
+def test_identical_bodies_reuse_compressed_bytes():
+    client, stats, _ = create_server()
+    first = client.post("/figure", headers={"Accept-Encoding": "gzip"})
+    second = client.post("/figure", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert first.data == second.data
+    assert stats == {"compressed": 1, "cache_hits": 1, "not_modified": 0}
+
+def test_cache_is_safe_across_threads():
+    server = Flask(__name__)
+
+    @server.route("/figure/<int:n>", methods=["POST"])
+    def figure(n):
+        return jsonify({"data": [{"x": list(range(200 + n))}]})
+
+    register_compression(server, cache_size=2)
+
+    def post(n):
+        response = server.test_client().post(
+            f"/figure/{n % 5}", headers={"Accept-Encoding": "gzip"}
+        )
+        return response.status_code, len(gzip.decompress(response.data))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(post, range(200)))
+    assert {status for status, _ in results} == {200}
+
+def test_matching_etag_returns_not_modified():
+    client, stats, _ = create_server()
+    etag = client.get("/figure", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = client.get(
+        "/figure", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.data == b""
+    assert stats["not_modified"] == 1
+
+def test_precompressed_paths_are_served_without_compressing():
+    client, stats, layout = create_server(precompress_paths=["/layout", "/small"])
+    response = client.get("/layout", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b'"div"' in gzip.decompress(response.data)
+    assert stats == {"compressed": 0, "cache_hits": 1, "not_modified": 0}
+
+    # A changed body is no longer the precompressed one
+    layout["version"] = 2
+    response = client.get("/layout", headers={"Accept-Encoding": "gzip"})
+    assert b'"version":2' in gzip.decompress(response.data)
+    assert stats["compressed"] == 1
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,8 +1,10 @@
 import pandas as pd
 import pytest
+import tracemalloc
 import sys
 sys.path.append('../src')
-from src.data import load_data, preprocess_data
+import numpy as np
+from src.data import DatasetSnapshot, load_data, preprocess_data
 
 def test_load_data():
     df = load_data(filepath="data/processed/cleaned_job_postings.pkl")
@@ -31,5 +33,53 @@ def test_preprocess_data():
     assert jobs_by_region['count'].sum() == 4  # Total count of jobs
     assert avg_salary_by_region.loc[avg_salary_by_region['region'] == 'East', 'avg_salary'].values[0] == 1625.0
 
+    # Testing that the input DataFrame is left unchanged
+    assert list(df.columns) == ["region", "min_salary", "max_salary"]
+
+    # Testing that a precomputed average salary is used as given
+    _, avg_salary_by_region, _ = preprocess_data(df, avg_salary=[1.0, 2.0, 3.0, 4.0])
+    assert avg_salary_by_region.loc[avg_salary_by_region['region'] == 'East', 'avg_salary'].values[0] == 2.0
+
+def test_dataset_snapshot():
+    df = pd.DataFrame({
+        "region": ["East", "West", None, "East"],
+        "min_salary": [1000.0, 1500.0, 1200.0, 1300.0],
+    })
+    snapshot = DatasetSnapshot.from_frame(df)
+    assert len(snapshot) == 4
+    assert snapshot.columns == ["region", "min_salary"]
+
+    # Columns are read-only and independent of the source DataFrame
+    with pytest.raises(ValueError):
+        snapshot["min_salary"][0] = 0.0
+    df.loc[0, "min_salary"] = 0.0
+    assert snapshot["min_salary"][0] == 1000.0
+
+    rows = snapshot.isin("region", ["East"]) & (snapshot["min_salary"] > 1100)
+    assert rows.tolist() == [False, False, False, True]
+    assert snapshot.take(rows, ["region"])["region"].tolist() == ["East"]
+    assert snapshot.take(np.array([1, 2]))["min_salary"].tolist() == [1500.0, 1200.0]
+
+def test_dataset_snapshot_copies_columns_once():
+    df = pd.DataFrame({"max_salary": np.arange(1_000_000, dtype=np.float64)})
+    column_bytes = df["max_salary"].to_numpy().nbytes
+    tracemalloc.start()
+    snapshot = DatasetSnapshot.from_frame(df)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1.5 * column_bytes
+    assert not np.shares_memory(snapshot["max_salary"], df["max_salary"].to_numpy())
+
+def test_dataset_snapshot_with_column():
+    snapshot = DatasetSnapshot({"min_salary": [1.0, 2.0], "max_salary": [3.0, 4.0]})
+    derived = snapshot.with_column(
+        "avg_salary", (snapshot["min_salary"] + snapshot["max_salary"]) / 2
+    )
+    assert derived["avg_salary"].tolist() == [2.0, 3.0]
+    assert derived["min_salary"] is snapshot["min_salary"]
+    assert "avg_salary" not in snapshot.columns
+    with pytest.raises(ValueError):
+        snapshot.with_column("avg_salary", [1.0])
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pytest
+import sys
+sys.path.append('../src')
+import src.registry as registry_module
+from src.registry import DatasetRegistry
+
+def write_dataset(tmp_path, name, n_rows):
+    df = pd.DataFrame({
+        "title": ["Data Scientist", "Sales Manager"] * (n_rows // 2),
+        "region": ["West", "East"] * (n_rows // 2),
+        "min_salary": [50000.0, 40000.0] * (n_rows // 2),
+        "max_salary": [90000.0, 60000.0] * (n_rows // 2),
+    })
+    filepath = str(tmp_path / f"{name}.pkl")
+    df.to_pickle(filepath)
+    return filepath
+
+@pytest.fixture
+def sources(tmp_path):
+    return {
+        "2023": write_dataset(tmp_path, "2023", 1000),
+        "2022": write_dataset(tmp_path, "2022", 1000),
+        "2021": write_dataset(tmp_path, "2021", 1000),
+    }
+
+def test_datasets_load_lazily(sources):
+    registry = DatasetRegistry(sources)
+    assert registry.default == "2023"
+    assert registry.memory_bytes == 0
+
+    dataset = registry.get()
+    assert dataset.name == "2023"
+    assert len(dataset.snapshot) == 1000
+    assert dataset.snapshot["avg_salary"][:2].tolist() == [70000.0, 50000.0]
+    assert dataset.jobs_by_region["count"].sum() == 1000
+    assert dataset.title_index.lookup("data").tolist() == list(range(0, 1000, 2))
+    assert registry.get("2023") is dataset
+
+    metrics = registry.metrics().set_index("dataset")
+    assert metrics.loc["2023", "loaded"] and not metrics.loc["2022", "loaded"]
+    assert metrics.loc["2023", "loads"] == 1
+    assert metrics.loc["2023", "hits"] == 1
+    assert metrics.loc["2023", "memory_mb"] > 0
+
+def test_least_recently_used_dataset_is_evicted(sources):
+    one_dataset_mb = DatasetRegistry(sources).get().memory_bytes / 1024**2
+    registry = DatasetRegistry(sources, memory_budget_mb=2.5 * one_dataset_mb)
+
+    registry.get("2023")
+    registry.get("2022")
+    registry.get("2023")
+    registry.get("2021")
+
+    metrics = registry.metrics().set_index("dataset")
+    assert metrics["loaded"].to_dict() == {"2023": True, "2022": False, "2021": True}
+    assert metrics.loc["2022", "evictions"] == 1
+    assert registry.memory_bytes <= registry.memory_budget_bytes
+
+    registry.get("2022")
+    assert registry.metrics().set_index("dataset").loc["2022", "loads"] == 2
+
+def test_requested_dataset_is_kept_over_budget(sources):
+    registry = DatasetRegistry(sources, memory_budget_mb=0)
+    registry.get("2023")
+    dataset = registry.get("2022")
+    assert registry.get("2022") is dataset
+    assert registry.metrics()["loaded"].tolist() == [False, True, False]
+
+def test_memory_includes_caches_grown_by_requests(sources):
+    registry = DatasetRegistry(sources)
+    dataset = registry.get()
+    before = dataset.memory_bytes
+    dataset.title_index.mask("s")
+    dataset.snapshot.isin("title", ["Data Scientist"])
+    assert dataset.memory_bytes > before
+    assert registry.metrics().loc[0, "memory_mb"] == dataset.memory_bytes / 1024**2
+
+def test_budget_is_checked_when_caches_grow(sources):
+    registry = DatasetRegistry(sources)
+    one_dataset_mb = registry.get("2023").memory_bytes / 1024**2
+    registry = DatasetRegistry(sources, memory_budget_mb=2.01 * one_dataset_mb)
+    registry.get("2023")
+    registry.get("2022").snapshot.isin("title", ["Sales Manager"])
+    registry.get("2022")
+    assert registry.metrics()["loaded"].tolist() == [False, True, False]
+
+def test_loading_does_not_block_loaded_datasets(sources, monkeypatch):
+    registry = DatasetRegistry(sources)
+    registry.get("2023")
+
+    loading = threading.Event()
+    release = threading.Event()
+    original_load_data = registry_module.load_data
+
+    def slow_load_data(filepath):
+        loading.set()
+        release.wait(timeout=5)
+        return original_load_data(filepath)
+
+    monkeypatch.setattr(registry_module, "load_data", slow_load_data)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(registry.get, "2022")
+        second = executor.submit(registry.get, "2022")
+        assert loading.wait(timeout=5)
+        assert executor.submit(registry.get, "2023").result(timeout=1).name == "2023"
+        release.set()
+        assert first.result(timeout=5) is second.result(timeout=5)
+
+    assert registry.metrics().set_index("dataset").loc["2022", "loads"] == 1
+
+def test_unknown_dataset(sources):
+    with pytest.raises(KeyError):
+        DatasetRegistry(sources).get("1999")
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.append('../src')
+import src.search as search_module
+from src.search import TitleIndex, load_title_index, title_index_path, tokenize
+
+TITLES = pd.Series([
+    "Senior Data Scientist",
+    "Data Engineer",
+    "Sales Manager",
+    "Data Science Manager",
+    None,
+])
+
+def test_tokenize():
+    assert tokenize("Senior Manager, Indirect Procurement") == [
+        "senior", "manager", "indirect", "procurement"
+    ]
+    assert tokenize(None) == []
+
+def test_lookup_exact_and_prefix():
+    index = TitleIndex.build(TITLES)
+    assert index.lookup("data engineer").tolist() == [1]
+    assert index.lookup("data sci").tolist() == [0, 3]
+    assert index.lookup("MANAGER").tolist() == [2, 3]
+    assert index.lookup("pilot").tolist() == []
+    assert index.lookup("  ") is None
+
+def test_lookup_finished_last_word_matches_exactly():
+    index = TitleIndex.build(pd.Series([
+        "Data Engineer", "Database Admin", "C++ Developer", "Customer Service"
+    ]))
+    assert index.lookup("data").tolist() == [0, 1]
+    assert index.lookup("data ").tolist() == [0]
+    assert index.lookup("c++").tolist() == [2]
+    assert index.mask("c++").tolist() == [False, False, True, False]
+
+def test_prefix_cache_is_safe_across_threads(monkeypatch):
+    monkeypatch.setattr(search_module, "PREFIX_CACHE_SIZE", 2)
+    titles = pd.Series([f"{a}{b} {a}" for a in "abcdef" for b in "xyz"] * 20)
+    index = TitleIndex.build(titles)
+    queries = list("abcdef") * 2000
+    expected = {q: index.lookup(q).tolist() for q in "abcdef"}
+
+    def lookup(query):
+        return query, index.lookup(query).tolist()
+
+    # Switch threads often so that unguarded cache updates would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lookup, queries))
+    finally:
+        sys.setswitchinterval(interval)
+    assert all(rows == expected[query] for query, rows in results)
+    assert len(index._prefix_cache) <= 2
+
+def test_mask_intersects_with_other_filters():
+    index = TitleIndex.build(TITLES)
+    df = pd.DataFrame({"title": TITLES, "min_salary": [90, 80, 50, 100, 10]})
+    mask = index.mask("data")
+    assert mask.dtype == np.bool_ and len(mask) == len(df)
+    assert df[mask & (df["min_salary"] >= 90)].index.tolist() == [0, 3]
+    assert index.mask("") is None
+
+def test_suggest():
+    index = TitleIndex.build(TITLES)
+    assert index.suggest("data sc") == ["science", "scientist"]
+    assert index.suggest("ma") == ["manager"]
+
+def test_complete_keeps_typed_text():
+    index = TitleIndex.build(TITLES)
+    assert index.complete("data sc") == ["data science", "data scientist"]
+    assert index.complete("Data-Sci") == ["Data-science", "Data-scientist"]
+    assert index.complete("senior data-eng") == ["senior data-engineer"]
+    assert index.complete("c++") == []
+    assert index.complete("data ") == []
+    assert index.complete(None) == []
+
+def test_load_title_index_saves_and_rebuilds(tmp_path):
+    filepath = str(tmp_path / "postings.pkl")
+    df = pd.DataFrame({"title": TITLES})
+    index = load_title_index(df, filepath)
+    assert (tmp_path / "postings_title_index.pkl").exists()
+    assert title_index_path(filepath).endswith("postings_title_index.pkl")
+    assert load_title_index(df, filepath).vocabulary == index.vocabulary
+
+    changed = pd.DataFrame({"title": ["Pilot"] * 5})
+    assert load_title_index(changed, filepath).vocabulary == ["pilot"]
+    assert [p.name for p in tmp_path.iterdir()] == ["postings_title_index.pkl"]
+
+def test_load_title_index_rebuilds_unreadable_file(tmp_path):
+    filepath = str(tmp_path / "postings.pkl")
+    df = pd.DataFrame({"title": TITLES})
+    load_title_index(df, filepath)
+
+    # A half-written file, as seen by a worker reading during another's write
+    with open(title_index_path(filepath), "rb") as f:
+        data = f.read()
+    with open(title_index_path(filepath), "wb") as f:
+        f.write(data[: len(data) // 2])
+    assert load_title_index(df, filepath).lookup("engineer").tolist() == [1]
+
+    with open(title_index_path(filepath), "wb") as f:
+        f.write(b"not a pickle")
+    assert load_title_index(df, filepath).lookup("engineer").tolist() == [1]
+
+if __name__ == "__main__":
+    pytest.main()